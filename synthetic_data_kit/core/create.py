@@ -4,8 +4,11 @@
 # This source code is licensed under the terms described in the LICENSE file in
 # the root directory of this source tree.
 # Generate the content: CoT/QA/Summary Datasets
+import functools
 import os
+import hashlib
 import json
+import mmap
 from pathlib import Path
 from typing import Optional
 
@@ -17,13 +20,150 @@ from synthetic_data_kit.generators.knowledge_list_generator import KnowledgeList
 from synthetic_data_kit.generators.extract_knowledge_generator import ExtractKnowledgeGenerator
 from synthetic_data_kit.generators.wikipedia_rephrase_generator import WikipediaRephraseGenerator
 
+from synthetic_data_kit.utils.config import get_format_config
 from synthetic_data_kit.utils.lance_utils import load_lance_dataset
 
+# orjson is optional: when present, record serialisation uses its Rust
+# encoder; otherwise stdlib json with the same output semantics
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_client(config_path, provider, api_base, model_name):
+    """Construct an LLMClient, reusing one per distinct settings tuple
+
+    Repeated process_file calls (directory runs, library users looping over
+    files) previously re-read the config and re-opened HTTP sessions per
+    file; caching on the constructor args keeps the connection pool and
+    config warm across invocations.
+    """
+    return LLMClient(
+        config_path=config_path,
+        provider=provider,
+        api_base=api_base,
+        model_name=model_name
+    )
+
+
 def read_json(file_path):
-    # Read the file
-    with open(file_path, 'r', encoding='utf-8') as f:
-        document_text = f.read()
-    return document_text
+    # Memory-map the file and decode once, instead of f.read() which keeps
+    # both the raw bytes and the decoded str resident for large inputs
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm[:].decode('utf-8')
+
+
+def write_json_stream(items, output_path):
+    """Write a list of records as a JSON array, one record at a time
+
+    Encoding record-by-record avoids building the full pretty-printed
+    document in the encoder's buffer next to the result list itself, which
+    matters when every record carries the original document text.
+    """
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write('[\n')
+        for i, item in enumerate(items):
+            if i:
+                f.write(',\n')
+            f.write(_dumps(item))
+        f.write('\n]\n')
+
+
+def write_jsonl(items, output_path):
+    """Write records as newline-delimited JSON, one object per line
+
+    JSONL skips the indent whitespace of pretty-printed output and is what
+    streaming consumers (HF datasets, the OpenAI Batch API) expect, with
+    constant memory on the producer side.
+    """
+    with open(output_path, 'w', encoding='utf-8') as f:
+        for item in items:
+            f.write(_dumps(item))
+            f.write('\n')
+
+
+def _write_qa_pairs_stream(records, output_path):
+    """Write streamed QA records as one {"qa_pairs": [...]} document
+
+    Pairs are flattened out of the per-chunk records and encoded one at a
+    time, so the file keeps the exact shape the non-streaming path (and
+    curate) expects without the full pair list ever being in memory.
+    """
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write('{"qa_pairs": [\n')
+        first = True
+        for record in records:
+            for pair in record["qa_pairs"]:
+                if not first:
+                    f.write(',\n')
+                f.write(_dumps(pair))
+                first = False
+        f.write('\n]}\n')
+
+
+def _dedupe_source_text(records, sources_path):
+    """Replace original_text with a content hash plus a one-time sidecar
+
+    Each record's original_text is swapped for a 16-hex source_hash, and
+    every distinct source text is written exactly once to a JSONL sidecar.
+    Strips the largest field from the serialisation hot path and stops
+    repeated documents from duplicating their text in the output.
+    """
+    seen = set()
+    with open(sources_path, 'w', encoding='utf-8') as f:
+        for record in records:
+            original = record.pop("original_text", None)
+            if original is not None:
+                source_hash = hashlib.sha256(original.encode('utf-8')).hexdigest()[:16]
+                record["source_hash"] = source_hash
+                if source_hash not in seen:
+                    seen.add(source_hash)
+                    f.write(_dumps({"source_hash": source_hash, "text": original}))
+                    f.write('\n')
+            yield record
+
+
+def _save_records(result, output_dir, base_name, suffix, pretty_json, dedupe_sources=False):
+    """Write generated records to disk
+
+    With format.pretty_json set (the shipped default), records go to a
+    streamed JSON array with a .json extension; with it disabled they go
+    to JSONL, which streaming consumers prefer. With dedupe_sources,
+    original_text is replaced by a source_hash reference and the texts
+    land once each in a {base}_sources.jsonl sidecar.
+    """
+    ext = "json" if pretty_json else "jsonl"
+    output_path = os.path.join(output_dir, f"{base_name}_{suffix}.{ext}")
+    print(f"Saving result to {output_path}")
+    if dedupe_sources:
+        sources_path = os.path.join(output_dir, f"{base_name}_sources.jsonl")
+        result = _dedupe_source_text(result, sources_path)
+    if pretty_json:
+        write_json_stream(result, output_path)
+    else:
+        write_jsonl(result, output_path)
+    return output_path
+
+
+def _generate_records(generator, documents, verbose, stream_results):
+    """Run a generator over documents, streaming records when enabled
+
+    With generation.stream_results set, records are yielded per batch and
+    can be written to disk as they arrive instead of accumulating the full
+    result list in memory first.
+    """
+    if stream_results:
+        return generator.iter_process_documents(documents=documents, verbose=verbose)
+    return generator.process_documents(documents=documents, verbose=verbose)
 
 
 def process_file(
@@ -38,6 +178,7 @@ def process_file(
     provider: Optional[str] = None,
     chunk_size: Optional[int] = None,
     chunk_overlap: Optional[int] = None,
+    client: Optional[LLMClient] = None,
 ) -> str:
     """Process a file to generate content
     
@@ -58,36 +199,53 @@ def process_file(
     # The reason for having this directory logic for now is explained in context.py
     os.makedirs(output_dir, exist_ok=True)
     
-    # Initialize LLM client
-    client = LLMClient(
-        config_path=config_path,
-        provider=provider,
-        api_base=api_base,
-        model_name=model
-    )
-    
-    # Override chunking config if provided
-    if chunk_size is not None:
-        client.config.setdefault('generation', {})['chunk_size'] = chunk_size
-    if chunk_overlap is not None:
-        client.config.setdefault('generation', {})['overlap'] = chunk_overlap
+    # Initialize (or reuse) the LLM client; callers may also supply their own
+    if client is None:
+        client = _get_client(config_path, provider, api_base, model)
     
+    # Chunking overrides are passed to the QA generator below; the client
+    # may come from the lru_cache and must not be mutated per call
+
     # Debug: Print which provider is being used
     print(f"L Using {client.provider} provider")
     
     # Generate base filename for output
     base_name = os.path.splitext(os.path.basename(file_path))[0]
     
+    generation_cfg = client.config.get('generation', {})
+    stream_results = generation_cfg.get('stream_results', False)
+    dedupe_sources = generation_cfg.get('dedupe_source_text', False)
+    # pretty_json is an output knob and lives under format:, not generation:
+    pretty_json = get_format_config(client.config).get('pretty_json', True)
+
     # Generate content based on type
     if file_path.endswith(".lance"):
         dataset = load_lance_dataset(file_path)
-        documents = dataset.to_table().to_pylist()
+        # Project only the columns used downstream and zip them into
+        # minimal dicts instead of materialising full-width rows
+        table = dataset.to_table(columns=["text", "id"])
+        documents = [
+            {"text": text, "id": doc_id}
+            for text, doc_id in zip(table.column("text").to_pylist(),
+                                    table.column("id").to_pylist())
+        ]
     else:
         documents = [{"text": read_json(file_path), "image": None}]
 
     if content_type == "qa":
-        generator = QAGenerator(client=client, config_path=config_path)
-        
+        generator = QAGenerator(client=client, config_path=config_path,
+                                chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+
+        # With streaming enabled, pairs go to disk as batches complete
+        # instead of accumulating in memory first; the output keeps the
+        # same {"qa_pairs": [...]} shape curate consumes
+        if stream_results:
+            records = generator.iter_process_documents(documents=documents, verbose=verbose)
+            output_path = os.path.join(output_dir, f"{base_name}_qa_pairs.json")
+            print(f"Saving result to {output_path}")
+            _write_qa_pairs_stream(records, output_path)
+            return output_path
+
         # Process document
         result = generator.process_documents(
             documents=documents,
@@ -107,72 +265,38 @@ def process_file(
         generator = DistillGenerator(client=client, config_path=config_path)
         
         # Process documents
-        result = generator.process_documents(
-            documents=documents,
-            verbose=verbose
-        )
+        result = _generate_records(generator, documents, verbose, stream_results)
         
         # Save output
-        output_path = os.path.join(output_dir, f"{base_name}_distilled.json")
-        print(f"Saving result to {output_path}")
-
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
-        
-        return output_path
+        return _save_records(result, output_dir, base_name, "distilled", pretty_json,
+                             dedupe_sources=dedupe_sources)
 
     elif content_type == "knowledge-list":
         generator = KnowledgeListGenerator(client=client, config_path=config_path)
         
         # Process documents
-        result = generator.process_documents(
-            documents,
-            verbose=verbose
-        )
+        result = _generate_records(generator, documents, verbose, stream_results)
         
         # Save output
-        output_path = os.path.join(output_dir, f"{base_name}_knowledge_list.json")
-        print(f"Saving result to {output_path}")
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
-        
-        return output_path
+        return _save_records(result, output_dir, base_name, "knowledge_list", pretty_json)
 
     elif content_type == "extract-knowledge":
         generator = ExtractKnowledgeGenerator(client=client, config_path=config_path)
         
         # Process documents
-        result = generator.process_documents(
-            documents=documents,
-            verbose=verbose
-        )
+        result = _generate_records(generator, documents, verbose, stream_results)
         
         # Save output
-        output_path = os.path.join(output_dir, f"{base_name}_extracted_knowledge.json")
-        print(f"Saving result to {output_path}")
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
-        
-        return output_path
+        return _save_records(result, output_dir, base_name, "extracted_knowledge", pretty_json,
+                             dedupe_sources=dedupe_sources)
 
     elif content_type == "wikipedia-rephrase":
         generator = WikipediaRephraseGenerator(client=client, config_path=config_path)
         
         # Process documents
-        result = generator.process_documents(
-            documents=documents,
-            verbose=verbose
-        )
+        result = _generate_records(generator, documents, verbose, stream_results)
         
         # Save output
-        output_path = os.path.join(output_dir, f"{base_name}_wikipedia_rephrased.json")
-        print(f"Saving result to {output_path}")
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
-        
-        return output_path
+        return _save_records(result, output_dir, base_name, "wikipedia_rephrased", pretty_json)
     else:
         raise ValueError(f"Unknown content type: {content_type}")
\ No newline at end of file
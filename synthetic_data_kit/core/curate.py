@@ -10,6 +10,8 @@ import json
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
+from rich.progress import Progress, BarColumn, TextColumn, TimeElapsedColumn, TimeRemainingColumn
+
 from synthetic_data_kit.models.llm_client import LLMClient
 from synthetic_data_kit.generators.qa_generator import QAGenerator
 from synthetic_data_kit.utils.config import get_curate_config, get_prompt
@@ -39,12 +41,6 @@ def curate_qa_pairs(
     Returns:
         Path to the cleaned output file
     """
-    # Set verbose either via CLI or via env variable. If its via CLI, set it to env variable
-    if verbose:
-        os.environ['SDK_VERBOSE'] = 'true'
-    else:
-        os.environ['SDK_VERBOSE'] = 'false'
-    
     # Load input file
     with open(input_path, 'r', encoding='utf-8') as f:
         data = json.load(f)
@@ -79,7 +75,9 @@ def curate_qa_pairs(
         api_base=api_base,
         model_name=model
     )
-    
+    # The explicit CLI flag is authoritative for client-side logging
+    client._verbose = verbose
+
     # Get threshold from args, then config, then default
     if threshold is None:
         config = client.config
@@ -132,24 +130,20 @@ def curate_qa_pairs(
     # This avoids conflicts with other output messages
     print(f"Processing {len(batches)} batches of QA pairs...")
     
-    # Only use detailed progress bar in verbose mode
-    if verbose:
-        from rich.progress import Progress, BarColumn, TextColumn, TimeElapsedColumn, TimeRemainingColumn
-        
-        progress_columns = [
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeElapsedColumn(),
-            TimeRemainingColumn(),
-        ]
-        
-        progress_ctx = Progress(*progress_columns)
-        rate_task = progress_ctx.add_task(f"Rating QA pairs", total=len(batches))
-        progress_ctx.start()
-    else:
-        progress_ctx = None
-        rate_task = None
+    # One progress bar for both modes: rich detects non-TTY output and
+    # degrades cleanly, so there is no separate \r-print path to thrash
+    # stdout when output is redirected
+    progress_columns = [
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+        TimeElapsedColumn(),
+        TimeRemainingColumn(),
+    ]
+
+    progress_ctx = Progress(*progress_columns)
+    rate_task = progress_ctx.add_task("Rating QA pairs", total=len(batches))
+    progress_ctx.start()
     
     # Process in inference batches
     for batch_start in range(0, len(all_messages), inference_batch):
@@ -160,11 +154,8 @@ def curate_qa_pairs(
         batch_num = batch_start//inference_batch + 1
         total_batches = (len(all_messages) + inference_batch - 1)//inference_batch
         
-        # Simple progress indicator for non-verbose mode
-        if not verbose:
-            print(f"Processing batch {batch_num}/{total_batches}...", end="\r")
-        else:
-            print(f"Processing batch {batch_num}/{total_batches}")
+        if verbose:
+            progress_ctx.console.log(f"Processing batch {batch_num}/{total_batches}")
         
         try:
             # Get ratings for the batch
@@ -193,7 +184,7 @@ def curate_qa_pairs(
                         if verbose:
                             print(f"Processing batch {original_batch_index+1}")
                             
-                        rated_batch = parse_ratings(response, original_batch)
+                        rated_batch = parse_ratings(response, original_batch, verbose=verbose)
                         
                         # Process the rated batch
                         for pair in rated_batch:
@@ -224,7 +215,7 @@ def curate_qa_pairs(
                                 )
                                 try:
                                     # This should be a single item
-                                    rated_item = parse_ratings(item_response, [item])
+                                    rated_item = parse_ratings(item_response, [item], verbose=verbose)
                                     if rated_item and len(rated_item) > 0:
                                         pair = rated_item[0]
                                         if "rating" in pair:
@@ -247,25 +238,19 @@ def curate_qa_pairs(
                         # Continue processing other batches rather than failing completely
                         pass
             
-            # Update progress bar if in verbose mode
-            if progress_ctx and rate_task:
-                progress_ctx.update(rate_task, advance=current_batch_size)
-            
+            # rate_task is a TaskID (int, may be 0) — no truthiness guard
+            progress_ctx.update(rate_task, advance=current_batch_size)
+
         except Exception as e:
             if verbose:
                 print(f"Error processing inference batch {batch_num}: {str(e)}")
-            
-            # Update progress bar if in verbose mode
-            if progress_ctx and rate_task:
-                progress_ctx.update(rate_task, advance=current_batch_size)
-    
-    # Stop progress bar if in verbose mode
-    if progress_ctx:
-        progress_ctx.stop()
+
+            # Count the failed batch as done so the bar still completes
+            progress_ctx.update(rate_task, advance=current_batch_size)
     
-    # Clear the progress line in non-verbose mode
+    progress_ctx.stop()
+
     if not verbose:
-        print(" " * 80, end="\r")
         print("Batch processing complete.")
     
     # Calculate metrics
@@ -3,9 +3,31 @@
 #
 # This source code is licensed under the terms described in the LICENSE file in
 # the root directory of this source tree.
-# Generator logic for both QA 
-from synthetic_data_kit.generators.qa_generator import QAGenerator
-from synthetic_data_kit.generators.distill_generator import DistillGenerator
-from synthetic_data_kit.generators.knowledge_list_generator import KnowledgeListGenerator
-from synthetic_data_kit.generators.extract_knowledge_generator import ExtractKnowledgeGenerator
-from synthetic_data_kit.generators.wikipedia_rephrase_generator import WikipediaRephraseGenerator
\ No newline at end of file
+# Generator logic for both QA
+import importlib
+
+__all__ = [
+    "QAGenerator",
+    "DistillGenerator",
+    "KnowledgeListGenerator",
+    "ExtractKnowledgeGenerator",
+    "WikipediaRephraseGenerator",
+]
+
+# Lazy loading (PEP 562): importing the package no longer pulls in every
+# generator module and its transitive dependencies; only the generator
+# actually requested gets imported.
+_LAZY = {
+    "QAGenerator": "synthetic_data_kit.generators.qa_generator",
+    "DistillGenerator": "synthetic_data_kit.generators.distill_generator",
+    "KnowledgeListGenerator": "synthetic_data_kit.generators.knowledge_list_generator",
+    "ExtractKnowledgeGenerator": "synthetic_data_kit.generators.extract_knowledge_generator",
+    "WikipediaRephraseGenerator": "synthetic_data_kit.generators.wikipedia_rephrase_generator",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name])
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,12 +6,13 @@
 # Base class for all generators
 
 from typing import Dict, List, Any, Optional
-import os
+import asyncio
 from pathlib import Path
 from rich.progress import Progress, BarColumn, TextColumn, TimeElapsedColumn
 
-from synthetic_data_kit.models.llm_client import LLMClient
+from synthetic_data_kit.models.llm_client import LLMClient, _run_coroutine
 from synthetic_data_kit.utils.config import load_config, get_generation_config, get_prompt
+from synthetic_data_kit.utils.llm_cache import LLMResponseCache, response_cache_key
 
 
 class BaseGenerator:
@@ -49,97 +50,374 @@ class BaseGenerator:
         """
         raise NotImplementedError("Subclasses must implement process_responses()")
     
-    def process_documents(self, 
-                          documents: List[Dict[str, Any]], 
+    def _get_cached_prompt(self) -> Dict[str, str]:
+        """Get the configured prompt, fetched from config only once"""
+        if not hasattr(self, "_prompt"):
+            prompt_name = self._get_prompt_name()
+            self._prompt = get_prompt(config=self.config, prompt_name=prompt_name)
+        return self._prompt
+
+    def _build_messages(self, documents: List[Dict[str, Any]]) -> List[List[Dict[str, str]]]:
+        """Build the chat messages for each document from the configured prompt"""
+        prompt = self._get_cached_prompt()
+
+        # One shared system string for every message dict, and the user
+        # template split once on its placeholder so each document needs a
+        # single concatenation instead of a str.format parse
+        system_content = prompt['system']
+        user_template = prompt['user']
+
+        if user_template.count('{') == 1 and user_template.count('{text}') == 1:
+            prefix, suffix = user_template.split('{text}', 1)
+            build_user = lambda doc_text: prefix + doc_text + suffix
+        else:
+            # Template has other braces/placeholders; keep format semantics
+            build_user = lambda doc_text: user_template.format(text=doc_text)
+
+        # The system message never varies within a run, so every message
+        # list shares one dict instead of allocating N identical copies;
+        # it is only ever read and serialised downstream
+        system_message = {"role": "system", "content": system_content}
+
+        all_messages = []
+        for doc in documents:
+            messages = [
+                system_message,
+                {"role": "user", "content": build_user(doc["text"])}
+            ]
+
+            all_messages.append(messages)
+
+        return all_messages
+
+    def _use_batch_api(self) -> bool:
+        """Whether to route this run through the provider's Batch API"""
+        return (bool(self.generation_config.get("use_batch_api", False))
+                and getattr(self.client, "provider", None) == "api-endpoint")
+
+    def _open_response_cache(self) -> Optional[LLMResponseCache]:
+        """Open the response cache if enabled in the generation config"""
+        if not self.generation_config.get("cache_responses", False):
+            return None
+        return LLMResponseCache(self.generation_config.get("cache_path"))
+
+    def _prefill_responses(self, cache, documents, all_messages):
+        """Resolve documents that don't need an LLM call
+
+        Whitespace-only documents get an empty sentinel response (an LLM
+        call on no content only produces garbage), and cache hits are
+        filled from disk. Returns (responses, keys, uncached_idx) where
+        responses holds the resolved text (None elsewhere), keys holds the
+        cache key per dispatched message, and uncached_idx lists the
+        positions that still need an LLM call, in original order.
+        """
+        n = len(all_messages)
+        responses: List[Optional[str]] = [None] * n
+        keys: List[Optional[str]] = [None] * n
+
+        model = getattr(self.client, "model", None)
+        # Responses depend on the sampling settings as much as the prompt;
+        # keying on them stops a settings change from replaying stale hits
+        sampling = (
+            self.generation_config.get("temperature", 0.7),
+            self.generation_config.get("max_tokens", 4096),
+            self.generation_config.get("top_p", 0.95),
+        )
+        uncached_idx = []
+        for i, (doc, messages) in enumerate(zip(documents, all_messages)):
+            if not doc["text"].strip():
+                responses[i] = ""
+                continue
+            if cache is not None:
+                keys[i] = response_cache_key(model, messages, sampling)
+                hit = cache.get(keys[i])
+                if hit is not None:
+                    responses[i] = hit
+                    continue
+            uncached_idx.append(i)
+        return responses, keys, uncached_idx
+
+    def _dedupe_pending(self, all_messages, uncached_idx):
+        """Collapse identical pending prompts into a single dispatch each
+
+        Returns (unique_idx, dup_groups): unique_idx holds one
+        representative position per distinct message (in original order),
+        and dup_groups maps each representative to every position sharing
+        that prompt so one response can be fanned back out to all of them.
+        """
+        seen: Dict[str, int] = {}
+        unique_idx: List[int] = []
+        dup_groups: Dict[int, List[int]] = {}
+        for i in uncached_idx:
+            key = response_cache_key(None, all_messages[i])
+            rep = seen.get(key)
+            if rep is None:
+                seen[key] = i
+                unique_idx.append(i)
+                dup_groups[i] = [i]
+            else:
+                dup_groups[rep].append(i)
+        return unique_idx, dup_groups
+
+    async def aprocess_documents(self,
+                                 documents: List[Dict[str, Any]],
+                                 verbose: bool = False) -> Any:
+        """Process multiple documents with true asyncio concurrency
+
+        All requests are dispatched at once through the client's async
+        completion method, bounded by a semaphore so at most
+        `llm_concurrency` requests are in flight at a time. This keeps the
+        server's queue full instead of waiting for each batch to drain.
+
+        Args:
+            documents: List of documents with 'text' field and 'id' field
+            verbose: Whether to show progress
+
+        Returns:
+            Processed results (format determined by subclass)
+        """
+        # The explicit argument is authoritative; bind it on the client
+        # instead of mutating process-global environment state, which is
+        # racy with concurrent generator instances
+        self.client._verbose = verbose
+
+        temperature = self.generation_config.get("temperature", 0.7)
+        concurrency = self.generation_config.get("llm_concurrency", 32)
+
+        all_messages = self._build_messages(documents)
+
+        cache = self._open_response_cache()
+        try:
+            all_responses, cache_keys, uncached_idx = self._prefill_responses(cache, documents, all_messages)
+            unique_idx, dup_groups = self._dedupe_pending(all_messages, uncached_idx)
+            num_resolved = len(all_messages) - len(unique_idx)
+            if num_resolved and verbose:
+                print(f"  Resolved {num_resolved} documents without an LLM call (cached, empty or duplicate)")
+
+            print(f"Processing {len(documents)} documents...")
+
+            sem = asyncio.Semaphore(concurrency)
+
+            try:
+                with Progress(
+                    TextColumn("[progress.description]{task.description}"),
+                    BarColumn(),
+                    TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                    TimeElapsedColumn(),
+                ) as progress:
+                    task = progress.add_task(
+                        f"Processing {len(documents)} documents...",
+                        total=len(documents)
+                    )
+                    progress.advance(task, num_resolved)
+
+                    async def one(messages):
+                        async with sem:
+                            response = await self.client.acomplete(messages, temperature=temperature)
+                        progress.advance(task, 1)
+                        return response
+
+                    new_responses = await asyncio.gather(*(one(all_messages[i]) for i in unique_idx))
+            finally:
+                # The pooled HTTP client belongs to this loop, which dies with
+                # this invocation; close it so the sockets are released
+                aclose = getattr(self.client, "_aclose_async_http_client", None)
+                if aclose is not None:
+                    await aclose()
+
+            # Stitch fresh responses back into original order (fanning each out
+            # to all duplicate positions) and write through
+            for rep, response in zip(unique_idx, new_responses):
+                for idx in dup_groups[rep]:
+                    all_responses[idx] = response
+                if cache is not None and cache_keys[rep] is not None:
+                    cache.put(cache_keys[rep], response)
+        finally:
+            if cache is not None:
+                cache.close()
+
+        # Call subclass-specific response processing
+        return self.process_responses(documents=documents, responses=all_responses, verbose=verbose)
+
+    def process_one(self, doc: Dict[str, Any], response: str) -> Dict[str, Any]:
+        """Process a single (document, response) pair into one result record
+
+        Used by the streaming path (`iter_process_documents`). Override in
+        subclasses that support streaming output.
+        """
+        raise NotImplementedError("Subclasses must implement process_one()")
+
+    def iter_process_documents(self,
+                               documents: List[Dict[str, Any]],
+                               verbose: bool = False):
+        """Yield one processed record per document as each batch completes
+
+        Unlike process_documents, only one batch of messages and responses
+        is alive at a time, so callers can write each record to disk within
+        one batch latency instead of waiting for the whole corpus.
+
+        Args:
+            documents: List of documents with 'text' field and 'id' field
+            verbose: Whether to show progress
+
+        Yields:
+            One record per document (shape determined by process_one)
+        """
+        # The explicit argument is authoritative; bind it on the client
+        # instead of mutating process-global environment state, which is
+        # racy with concurrent generator instances
+        self.client._verbose = verbose
+
+        batch_size = self.generation_config.get("batch_size", 32)
+        temperature = self.generation_config.get("temperature", 0.7)
+
+        cache = self._open_response_cache()
+
+        print(f"Processing {len(documents)} documents...")
+
+        try:
+            for batch_start in range(0, len(documents), batch_size):
+                batch_docs = documents[batch_start:batch_start + batch_size]
+                batch_messages = self._build_messages(batch_docs)
+
+                responses, cache_keys, uncached_idx = self._prefill_responses(cache, batch_docs, batch_messages)
+                unique_idx, dup_groups = self._dedupe_pending(batch_messages, uncached_idx)
+                pending_messages = [batch_messages[i] for i in unique_idx]
+
+                if pending_messages:
+                    fresh = self.client.batch_completion(
+                        pending_messages,
+                        temperature=temperature,
+                        batch_size=batch_size
+                    )
+                    for rep, response in zip(unique_idx, fresh):
+                        for idx in dup_groups[rep]:
+                            responses[idx] = response
+                        if cache is not None and cache_keys[rep] is not None:
+                            cache.put(cache_keys[rep], response)
+
+                for doc, response in zip(batch_docs, responses):
+                    yield self.process_one(doc, response)
+        finally:
+            if cache is not None:
+                cache.close()
+
+    def process_documents(self,
+                          documents: List[Dict[str, Any]],
                           verbose: bool = False) -> Any:
         """Process multiple documents using batch processing
-        
+
         This method handles the common workflow:
         1. Prepare messages for all documents
         2. Process in parallel batches
         3. Call process_responses() to format results
-        
+
+        Clients that implement `acomplete` (the async single-request API)
+        are driven through `aprocess_documents` so all requests are in
+        flight concurrently; other clients fall back to the sequential
+        per-batch `batch_completion` loop.
+
         Args:
             documents: List of documents with 'text' field and 'id' field
             verbose: Whether to show progress
-            
+
         Returns:
             Processed results (format determined by subclass)
         """
-        # Set the verbose environment variable
-        if verbose:
-            os.environ['SDK_VERBOSE'] = 'true'
-        else:
-            os.environ['SDK_VERBOSE'] = 'false'
-        
+        # Use the concurrent async path when the client supports it
+        if (not self._use_batch_api()
+                and asyncio.iscoroutinefunction(getattr(self.client, "acomplete", None))):
+            return _run_coroutine(self.aprocess_documents(documents=documents, verbose=verbose))
+
+        # The explicit argument is authoritative; bind it on the client
+        # instead of mutating process-global environment state, which is
+        # racy with concurrent generator instances
+        self.client._verbose = verbose
+
         # Get batch size and temperature from config
         batch_size = self.generation_config.get("batch_size", 32)
         temperature = self.generation_config.get("temperature", 0.7)
-        
-        # Get prompt from config
-        prompt_name = self._get_prompt_name()
-        prompt = get_prompt(config=self.config, prompt_name=prompt_name)
-        
-        # Prepare all message batches
-        all_messages = []
-        for doc in documents:
-            doc_text = doc["text"]
-            
-            system_content = prompt['system']
-            user_content = prompt['user'].format(text=doc_text)
-            messages = [
-                {"role": "system", "content": system_content},
-                {"role": "user", "content": user_content}
-            ]
-                
-            all_messages.append(messages)
-        
-        print(f"Processing {len(documents)} documents...")
-        
-        # Process in batches using batch_completion
-        all_responses = []
-        with Progress(
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeElapsedColumn(),
-        ) as progress:
-            task = progress.add_task(
-                f"Processing {len(documents)} documents...", 
-                total=len(documents)
-            )
-            
-            for batch_start in range(0, len(documents), batch_size):
-                batch_end = min(batch_start + batch_size, len(documents))
-                batch_messages = all_messages[batch_start:batch_end]
-                current_batch_size = len(batch_messages)
-                
-                batch_num = batch_start // batch_size + 1
-                total_batches = (len(documents) + batch_size - 1) // batch_size
-                
-                if not verbose:
-                    print(f"Processing batch {batch_num}/{total_batches}...", end="\r")
-                else:
-                    print(f"Processing batch {batch_num}/{total_batches} with {current_batch_size} documents")
-                
-
-                batch_responses = self.client.batch_completion(
-                    batch_messages,
-                    temperature=temperature,
-                    batch_size=batch_size
+
+        all_messages = self._build_messages(documents)
+
+        cache = self._open_response_cache()
+        try:
+            all_responses, cache_keys, uncached_idx = self._prefill_responses(cache, documents, all_messages)
+            unique_idx, dup_groups = self._dedupe_pending(all_messages, uncached_idx)
+            num_resolved = len(all_messages) - len(unique_idx)
+            if num_resolved and verbose:
+                print(f"  Resolved {num_resolved} documents without an LLM call (cached, empty or duplicate)")
+            pending_messages = [all_messages[i] for i in unique_idx]
+
+            print(f"Processing {len(documents)} documents...")
+
+            # Latency-insensitive runs can go through the provider's Batch API:
+            # one upload, background processing, results fetched when complete
+            if self._use_batch_api():
+                if pending_messages:
+                    batch_responses = self.client.batch_api_completion(
+                        pending_messages,
+                        temperature=temperature
+                    )
+                    for offset, response in enumerate(batch_responses):
+                        rep = unique_idx[offset]
+                        for idx in dup_groups[rep]:
+                            all_responses[idx] = response
+                        if cache is not None and cache_keys[rep] is not None:
+                            cache.put(cache_keys[rep], response)
+                return self.process_responses(documents=documents, responses=all_responses, verbose=verbose)
+
+            # Process in batches using batch_completion
+            with Progress(
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                TimeElapsedColumn(),
+            ) as progress:
+                task = progress.add_task(
+                    f"Processing {len(documents)} documents...",
+                    total=len(documents)
                 )
-                
-                all_responses.extend(batch_responses)
-                
-                if verbose:
-                    print(f"  Received {len(batch_responses)} responses")
-                
-                # Update progress
-                progress.advance(task, current_batch_size)
-                    
-        # Clear the progress line in non-verbose mode
-        if not verbose:
-            print(" " * 80, end="\r")
-        
+                progress.advance(task, num_resolved)
+
+                # Precompute the batch boundaries once instead of re-deriving
+                # batch_num/total_batches arithmetic per iteration
+                boundaries = list(range(0, len(pending_messages), batch_size))
+                total_batches = len(boundaries)
+
+                for batch_num, batch_start in enumerate(boundaries, 1):
+                    batch_messages = pending_messages[batch_start:batch_start + batch_size]
+                    current_batch_size = len(batch_messages)
+
+                    if verbose:
+                        progress.console.log(
+                            f"Processing batch {batch_num}/{total_batches} "
+                            f"with {current_batch_size} documents"
+                        )
+
+                    batch_responses = self.client.batch_completion(
+                        batch_messages,
+                        temperature=temperature,
+                        batch_size=batch_size
+                    )
+
+                    # Stitch responses back into original order (fanning each
+                    # out to all duplicate positions) and write through
+                    for offset, response in enumerate(batch_responses):
+                        rep = unique_idx[batch_start + offset]
+                        for idx in dup_groups[rep]:
+                            all_responses[idx] = response
+                        if cache is not None and cache_keys[rep] is not None:
+                            cache.put(cache_keys[rep], response)
+
+                    if verbose:
+                        progress.console.log(f"  Received {len(batch_responses)} responses")
+
+                    # Update progress
+                    progress.advance(task, current_batch_size)
+        finally:
+            if cache is not None:
+                cache.close()
+
         # Call subclass-specific response processing
         return self.process_responses(documents=documents, responses=all_responses, verbose=verbose)
@@ -9,9 +9,12 @@ from typing import Dict, List, Any, Optional
 import os
 from pathlib import Path
 
+import numpy as np
+
 from synthetic_data_kit.models.llm_client import LLMClient
 from synthetic_data_kit.generators.base import BaseGenerator
 from synthetic_data_kit.utils.config import get_prompt
+from synthetic_data_kit.utils.stats import compression_ratios
 
 
 class DistillGenerator(BaseGenerator):
@@ -21,7 +24,18 @@ class DistillGenerator(BaseGenerator):
         """Initialize the Distill Generator with an LLM client and optional config"""
         super().__init__(client, config_path)
     
-    def process_responses(self, 
+    def process_one(self, doc: Dict[str, Any], response: str) -> Dict[str, Any]:
+        """Build the result record for a single distilled document"""
+        return {
+            "id": doc["id"],
+            "text": response,
+            "original_text": doc["text"],
+            "original_length": len(doc["text"]),
+            "distilled_length": len(response),
+            "compression_ratio": len(response) / max(len(doc["text"]), 1)
+        }
+
+    def process_responses(self,
                          documents: List[Dict[str, Any]], 
                          responses: List[str],
                          verbose: bool = False) -> List[Dict[str, Any]]:
@@ -35,24 +49,37 @@ class DistillGenerator(BaseGenerator):
         Returns:
             List of results with distilled text and metadata
         """
-        results = []
-        for i, (doc, distilled) in enumerate(zip(documents, responses)):
-            result = {
+        # Vectorise the length/ratio metadata in one pass instead of
+        # per-item Python arithmetic
+        orig_lens = np.fromiter((len(doc["text"]) for doc in documents),
+                                dtype=np.int64, count=len(documents))
+        new_lens = np.fromiter((len(distilled) for distilled in responses),
+                               dtype=np.int64, count=len(responses))
+        ratios = compression_ratios(orig_lens, new_lens)
+
+        results = [
+            {
                 "id": doc["id"],
                 "text": distilled,
                 "original_text": doc["text"],
-                "original_length": len(doc["text"]),
-                "distilled_length": len(distilled),
-                "compression_ratio": len(distilled) / len(doc["text"])
+                "original_length": orig_len,
+                "distilled_length": new_len,
+                "compression_ratio": ratio
             }
-            results.append(result)
-            
-            if verbose:
-                print(f"  Distilled text for {doc['id']} ({len(distilled)} chars, "
-                      f"{result['compression_ratio']:.2%} of original)")
-        
+            for doc, distilled, orig_len, new_len, ratio in zip(
+                documents, responses, orig_lens.tolist(), new_lens.tolist(), ratios.tolist()
+            )
+        ]
+
+        if verbose:
+            print("\n".join(
+                f"  Distilled text for {result['id']} ({result['distilled_length']} chars, "
+                f"{result['compression_ratio']:.2%} of original)"
+                for result in results
+            ))
+
         print(f"✅ Successfully distilled {len(results)} documents")
-        
+
         return results
 
     def _get_prompt_name(self) -> str:
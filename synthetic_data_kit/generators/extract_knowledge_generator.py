@@ -8,8 +8,11 @@
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
+import numpy as np
+
 from synthetic_data_kit.models.llm_client import LLMClient
 from synthetic_data_kit.generators.base import BaseGenerator
+from synthetic_data_kit.utils.stats import compression_ratios
 
 
 class ExtractKnowledgeGenerator(BaseGenerator):
@@ -19,7 +22,18 @@ class ExtractKnowledgeGenerator(BaseGenerator):
         """Initialize the Extract Knowledge Generator with an LLM client and optional config"""
         super().__init__(client, config_path)
     
-    def process_responses(self, 
+    def process_one(self, doc: Dict[str, Any], response: str) -> Dict[str, Any]:
+        """Build the result record for a single extracted document"""
+        return {
+            "id": doc["id"],
+            "text": response,
+            "original_text": doc["text"],
+            "original_length": len(doc["text"]),
+            "knowledge_length": len(response),
+            "compression_ratio": len(response) / max(len(doc["text"]), 1)
+        }
+
+    def process_responses(self,
                          documents: List[Dict[str, Any]], 
                          responses: List[str],
                          verbose: bool = False) -> List[Dict[str, Any]]:
@@ -33,24 +47,37 @@ class ExtractKnowledgeGenerator(BaseGenerator):
         Returns:
             List of results with extracted/rewritten knowledge and metadata
         """
-        results = []
-        for i, (doc, knowledge) in enumerate(zip(documents, responses)):
-            result = {
+        # Vectorise the length/ratio metadata in one pass instead of
+        # per-item Python arithmetic
+        orig_lens = np.fromiter((len(doc["text"]) for doc in documents),
+                                dtype=np.int64, count=len(documents))
+        new_lens = np.fromiter((len(knowledge) for knowledge in responses),
+                               dtype=np.int64, count=len(responses))
+        ratios = compression_ratios(orig_lens, new_lens)
+
+        results = [
+            {
                 "id": doc["id"],
                 "text": knowledge,
                 "original_text": doc["text"],
-                "original_length": len(doc["text"]),
-                "knowledge_length": len(knowledge),
-                "compression_ratio": len(knowledge) / len(doc["text"])
+                "original_length": orig_len,
+                "knowledge_length": new_len,
+                "compression_ratio": ratio
             }
-            results.append(result)
-            
-            if verbose:
-                print(f"  Extracted knowledge for {doc['id']} ({len(knowledge)} chars, "
-                      f"{result["compression_ratio"]:.2%} of original)")
-        
+            for doc, knowledge, orig_len, new_len, ratio in zip(
+                documents, responses, orig_lens.tolist(), new_lens.tolist(), ratios.tolist()
+            )
+        ]
+
+        if verbose:
+            print("\n".join(
+                f"  Extracted knowledge for {result['id']} ({result['knowledge_length']} chars, "
+                f"{result['compression_ratio']:.2%} of original)"
+                for result in results
+            ))
+
         print(f"✅ Successfully extracted knowledge from {len(results)} documents")
-        
+
         return results
 
     def _get_prompt_name(self) -> str:
@@ -5,6 +5,10 @@
 # the root directory of this source tree.
 # Create QA Pairs
 
+import atexit
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
@@ -12,53 +16,149 @@ from synthetic_data_kit.models.llm_client import LLMClient
 from synthetic_data_kit.generators.base import BaseGenerator
 from synthetic_data_kit.utils.llm_processing import parse_qa_pairs
 from synthetic_data_kit.utils.config import load_config, get_generation_config
+from synthetic_data_kit.utils.text import split_into_chunks
+
+# Below this many items the process-pool start-up cost outweighs the
+# parallel work, so small inputs stay on the inline path
+_PARALLEL_PARSE_MIN = 32
 
 class QAGenerator(BaseGenerator):
-    def __init__(self, 
+    # Shared across instances; created lazily on the first large batch
+    _parse_pool = None
+
+    @classmethod
+    def _get_pool(cls) -> ProcessPoolExecutor:
+        """Return the shared process pool, creating it on first use
+
+        Worker count defaults to the machine's cores; SDK_PARSE_WORKERS
+        caps it for constrained environments (CI, parallel test runs).
+        """
+        if cls._parse_pool is None:
+            workers = int(os.environ.get("SDK_PARSE_WORKERS", "0")) or os.cpu_count()
+            cls._parse_pool = ProcessPoolExecutor(max_workers=workers)
+            atexit.register(cls._shutdown_pool)
+        return cls._parse_pool
+
+    @classmethod
+    def _shutdown_pool(cls) -> None:
+        """Shut down the shared process pool (registered atexit)"""
+        if cls._parse_pool is not None:
+            cls._parse_pool.shutdown()
+            cls._parse_pool = None
+
+    def __init__(self,
                  client: LLMClient,
-                 config_path: Optional[Path] = None):
-        """Initialize the QA Generator with an LLM client and optional config"""
+                 config_path: Optional[Path] = None,
+                 chunk_size: Optional[int] = None,
+                 chunk_overlap: Optional[int] = None):
+        """Initialize the QA Generator with an LLM client and optional config
+
+        chunk_size and chunk_overlap override the generation config for
+        this instance; the CLI flags are threaded through here.
+        """
         super().__init__(client, config_path)
-    
-    def process_responses(self, 
-                         documents: List[Dict[str, Any]], 
+        self._chunk_size = chunk_size
+        self._chunk_overlap = chunk_overlap
+
+    def _chunk_documents(self, documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Split every document into chunk-level documents
+
+        Each chunk keeps its owning document's id so parsed pairs can be
+        tagged after the responses come back.
+        """
+        # Per-instance overrides (the CLI flags) win over the config
+        chunk_size = (self._chunk_size if self._chunk_size is not None
+                      else self.generation_config.get("chunk_size", 4000))
+        overlap = (self._chunk_overlap if self._chunk_overlap is not None
+                   else self.generation_config.get("overlap", 200))
+
+        # Chunking is pure string work, so large corpora are split across
+        # cores; small ones stay inline where pool overhead would dominate
+        if len(documents) >= _PARALLEL_PARSE_MIN:
+            splitter = partial(split_into_chunks, chunk_size=chunk_size, overlap=overlap)
+            chunks_per_doc = list(self._get_pool().map(
+                splitter, (doc["text"] for doc in documents), chunksize=4))
+        else:
+            chunks_per_doc = [
+                split_into_chunks(doc["text"], chunk_size=chunk_size, overlap=overlap)
+                for doc in documents
+            ]
+
+        chunk_docs = []
+        for doc, chunks in zip(documents, chunks_per_doc):
+            chunk_docs.extend(
+                {"id": doc.get("id"), "text": chunk}
+                for chunk in chunks
+            )
+        return chunk_docs
+
+    def process_documents(self,
+                         documents: List[Dict[str, Any]],
+                         verbose: bool = False) -> Dict[str, Any]:
+        """Chunk every document up front and dispatch one flat batch
+
+        All chunks across all documents are submitted together, so the
+        backend sees chunks_per_doc * num_docs requests in one batched
+        dispatch instead of one small batch per document.
+        """
+        chunk_docs = self._chunk_documents(documents)
+        return super().process_documents(documents=chunk_docs, verbose=verbose)
+
+    def iter_process_documents(self,
+                              documents: List[Dict[str, Any]],
+                              verbose: bool = False):
+        """Stream per-chunk QA records over the flattened chunk list"""
+        chunk_docs = self._chunk_documents(documents)
+        yield from super().iter_process_documents(documents=chunk_docs, verbose=verbose)
+
+    def process_one(self, doc: Dict[str, Any], response: str) -> Dict[str, Any]:
+        """Build the streamed record for a single chunk response"""
+        qa_pairs = parse_qa_pairs(text=response)
+        for pair in qa_pairs:
+            pair["id"] = doc.get("id")
+        return {"id": doc.get("id"), "qa_pairs": qa_pairs}
+
+    @classmethod
+    def _parse_responses(cls, responses: List[str]) -> List[List[Dict[str, str]]]:
+        """Parse raw responses, fanning large batches out to a process pool
+
+        parse_qa_pairs is regex-heavy and CPU-bound, so big batches are
+        parsed across cores while small ones stay inline.
+        """
+        if len(responses) >= _PARALLEL_PARSE_MIN:
+            return list(cls._get_pool().map(parse_qa_pairs, responses, chunksize=16))
+        return [parse_qa_pairs(text=response) for response in responses]
+
+    def process_responses(self,
+                         documents: List[Dict[str, Any]],
                          responses: List[str],
                          verbose: bool = False) -> Dict[str, Any]:
         """Process QA generation responses into structured results
-        
+
         Args:
-            documents: Original input documents
+            documents: Chunk-level input documents (one per response)
             responses: Raw LLM responses (QA pairs text)
             verbose: Whether to show detailed output
-            
+
         Returns:
-            Dict with document IDs as keys, each containing 'original_text' and 'qa_pairs'
+            Dict with a 'qa_pairs' list; each pair carries the id of the
+            document its chunk came from
         """
-        result = {}
-        total_qa_pairs = 0
-        
-        for doc_idx, response in enumerate(responses):
-            doc_id = documents[doc_idx]["id"]
-            original_text = documents[doc_idx]["text"]
-            qa_pairs = parse_qa_pairs(text=response)
-            
-            # Create entry for this document
-            result[doc_id] = {
-                "original_text": original_text,
-                "qa_pairs": qa_pairs
-            }
-            
-            if qa_pairs:
-                total_qa_pairs += len(qa_pairs)
-                if verbose:
-                    print(f"  {doc_id}: {len(qa_pairs)} QA pairs")
-        
-        if verbose:
-            print(f"\n✅ Generated QA pairs per document:")
-        
-        print(f"✅ Total: {total_qa_pairs} QA pairs generated from {len(documents)} documents")
-
-        return result
+        all_qa_pairs = []
+        parsed = self._parse_responses(responses)
+
+        for doc, qa_pairs in zip(documents, parsed):
+            doc_id = doc.get("id")
+            for pair in qa_pairs:
+                pair["id"] = doc_id
+            all_qa_pairs.extend(qa_pairs)
+
+            if verbose and qa_pairs:
+                print(f"  {doc_id}: {len(qa_pairs)} QA pairs")
+
+        print(f"✅ Total: {len(all_qa_pairs)} QA pairs generated from {len(documents)} chunks")
+
+        return {"qa_pairs": all_qa_pairs}
 
     def _get_prompt_name(self) -> str:
         """Return the name of the prompt to use from config"""
@@ -12,14 +12,37 @@ from synthetic_data_kit.models.llm_client import LLMClient
 from synthetic_data_kit.generators.base import BaseGenerator
 
 
+# Boilerplate lead-in some models prepend despite the prompt asking for
+# the paraphrase only
+_REPHRASE_PREFIX = "Here is a paraphrased version: "
+
+
 class WikipediaRephraseGenerator(BaseGenerator):
-    def __init__(self, 
+    def __init__(self,
                  client: LLMClient,
                  config_path: Optional[Path] = None):
         """Initialize the Wikipedia Rephrase Generator with an LLM client and optional config"""
         super().__init__(client, config_path)
     
-    def process_responses(self, 
+    def _strip_prefix(self, response: str) -> str:
+        """Drop the boilerplate lead-in if the model prepended it
+
+        str.removeprefix would be neater, but the package still supports
+        Python 3.8.
+        """
+        if response.startswith(_REPHRASE_PREFIX):
+            return response[len(_REPHRASE_PREFIX):]
+        return response
+
+    def process_one(self, doc: Dict[str, Any], response: str) -> Dict[str, Any]:
+        """Build the result record for a single rephrased document"""
+        return {
+            "id": doc["id"],
+            "text": self._strip_prefix(response),
+            "original_text": doc["text"],
+        }
+
+    def process_responses(self,
                          documents: List[Dict[str, Any]], 
                          responses: List[str],
                          verbose: bool = False) -> List[Dict[str, Any]]:
@@ -35,6 +58,7 @@ class WikipediaRephraseGenerator(BaseGenerator):
         """
         results = []
         for i, (doc, rephrased) in enumerate(zip(documents, responses)):
+            rephrased = self._strip_prefix(rephrased)
             result = {
                 "id": doc["id"],
                 "text": rephrased,
@@ -6,11 +6,13 @@
 # Supports both vLLM and API endpoint (including OpenAI-compatible) providers
 from typing import List, Dict, Any, Optional, Union, Tuple
 import requests
+import httpx
 import json
 import time
 import os
 import logging
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from synthetic_data_kit.utils.config import load_config, get_vllm_config, get_openai_config, get_llm_provider
@@ -28,6 +30,22 @@ except ImportError:
     OPENAI_AVAILABLE = False
     logger.warning("OpenAI package not installed. To use API endpoint provider, install with 'pip install openai>=1.0.0'")
 
+
+def _run_coroutine(coro):
+    """Drive a coroutine to completion from synchronous code
+
+    asyncio.run raises RuntimeError when an event loop is already running
+    (e.g. inside Jupyter), so in that case the coroutine is run on a fresh
+    loop in a worker thread instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
 class LLMClient:
     def __init__(self, 
                  config_path: Optional[Path] = None,
@@ -50,7 +68,12 @@ class LLMClient:
         """
         # Load config
         self.config = load_config(config_path)
-        
+
+        # Bind the verbose flag once instead of re-reading (and
+        # re-lowercasing) the environment variable on every request;
+        # generators overwrite this with their explicit verbose argument
+        self._verbose = os.environ.get('SDK_VERBOSE', 'false').lower() == 'true'
+
         # Determine provider (with CLI override taking precedence)
         self.provider = provider or get_llm_provider(self.config)
         
@@ -118,6 +141,111 @@ class LLMClient:
         
         self.openai_client = OpenAI(**client_kwargs)
     
+    def _get_async_http_client(self):
+        """Get a shared httpx.AsyncClient bound to the running event loop
+
+        Reusing one client keeps a single connection pool open across all
+        concurrent requests instead of paying the TCP/TLS handshake per call.
+        A fresh client is created if the event loop changed (e.g. a new
+        `asyncio.run` invocation).
+        """
+        loop = asyncio.get_running_loop()
+        if getattr(self, '_async_http_client', None) is None or self._async_http_loop is not loop:
+            batch_size = self.config.get('generation', {}).get('batch_size', 32)
+            limits = httpx.Limits(
+                max_connections=batch_size * 2,
+                max_keepalive_connections=batch_size
+            )
+            self._async_http_client = httpx.AsyncClient(timeout=180, limits=limits)
+            self._async_http_loop = loop
+        return self._async_http_client
+
+    async def _aclose_async_http_client(self):
+        """Close the pooled async HTTP client at the end of a run
+
+        Each `asyncio.run` invocation owns its own client, so it must be
+        closed before that loop exits; otherwise its sockets are abandoned
+        when the next run replaces the client.
+        """
+        client = getattr(self, '_async_http_client', None)
+        if client is not None:
+            self._async_http_client = None
+            self._async_http_loop = None
+            await client.aclose()
+
+    async def acomplete(self,
+                        messages: List[Dict[str, str]],
+                        temperature: float = None,
+                        max_tokens: int = None,
+                        top_p: float = None) -> str:
+        """Generate a single chat completion asynchronously
+
+        This is the async counterpart of chat_completion. Callers can issue
+        many of these concurrently (e.g. via asyncio.gather) so the server
+        sees all requests at once rather than one batch at a time.
+
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            temperature: Sampling temperature (higher = more random)
+            max_tokens: Maximum tokens to generate
+            top_p: Nucleus sampling parameter
+
+        Returns:
+            String containing the generated text
+        """
+        # Get defaults from config if not provided
+        generation_config = self.config.get('generation', {})
+        temperature = temperature if temperature is not None else generation_config.get('temperature', 0.1)
+        max_tokens = max_tokens if max_tokens is not None else generation_config.get('max_tokens', 4096)
+        top_p = top_p if top_p is not None else generation_config.get('top_p', 0.95)
+
+        verbose = self._verbose
+        debug_mode = os.environ.get('SDK_DEBUG', 'false').lower() == 'true'
+
+        if self.provider == 'api-endpoint':
+            return await self._process_message_async(messages, temperature, max_tokens, top_p, verbose, debug_mode)
+        else:  # Default to vLLM
+            return await self._vllm_acomplete(messages, temperature, max_tokens, top_p, verbose)
+
+    async def _vllm_acomplete(self,
+                              messages: List[Dict[str, str]],
+                              temperature: float,
+                              max_tokens: int,
+                              top_p: float,
+                              verbose: bool) -> str:
+        """Generate a chat completion asynchronously against the vLLM OpenAI-compatible API"""
+        data = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "top_p": top_p
+        }
+
+        client = self._get_async_http_client()
+
+        for attempt in range(self.max_retries):
+            try:
+                if verbose:
+                    logger.info(f"Sending request to vLLM model {self.model}...")
+
+                response = await client.post(
+                    f"{self.api_base}/chat/completions",
+                    headers={"Content-Type": "application/json"},
+                    json=data
+                )
+
+                if verbose:
+                    logger.info(f"Received response with status code: {response.status_code}")
+
+                response.raise_for_status()
+                return response.json()["choices"][0]["message"]["content"]
+
+            except Exception as e:
+                if attempt == self.max_retries - 1:
+                    raise Exception(f"Failed to get vLLM completion after {self.max_retries} attempts: {str(e)}")
+                await asyncio.sleep(self.retry_delay * (attempt + 1))  # Exponential backoff
+
     def _check_vllm_server(self) -> tuple:
         """Check if the VLLM server is running and accessible"""
         try:
@@ -150,7 +278,7 @@ class LLMClient:
         max_tokens = max_tokens if max_tokens is not None else generation_config.get('max_tokens', 4096)
         top_p = top_p if top_p is not None else generation_config.get('top_p', 0.95)
         
-        verbose = os.environ.get('SDK_VERBOSE', 'false').lower() == 'true'
+        verbose = self._verbose
         
         if self.provider == 'api-endpoint':
             return self._openai_chat_completion(messages, temperature, max_tokens, top_p, verbose)
@@ -336,14 +464,101 @@ class LLMClient:
         top_p = top_p if top_p is not None else generation_config.get('top_p', 0.95)
         batch_size = batch_size if batch_size is not None else generation_config.get('batch_size', 32)
         
-        verbose = os.environ.get('SDK_VERBOSE', 'false').lower() == 'true'
+        verbose = self._verbose
         
         if self.provider == 'api-endpoint':
             return self._openai_batch_completion(message_batches, temperature, max_tokens, top_p, batch_size, verbose)
         else:  # Default to vLLM
             return self._vllm_batch_completion(message_batches, temperature, max_tokens, top_p, batch_size, verbose)
     
-    async def _process_message_async(self, 
+    def batch_api_completion(self,
+                             message_batches: List[List[Dict[str, str]]],
+                             temperature: float = None,
+                             max_tokens: int = None,
+                             top_p: float = None) -> List[str]:
+        """Process message sets through the provider's Batch API
+
+        Offline generation is latency-insensitive, so instead of hammering
+        /v1/chat/completions the whole workload is uploaded as one JSONL
+        file to /v1/batches, polled until complete, and the results are
+        returned in the original order. On OpenAI this halves the cost and
+        draws from a separate, larger rate-limit pool.
+
+        Args:
+            message_batches: List of message sets to process
+            temperature: Sampling temperature (higher = more random)
+            max_tokens: Maximum tokens to generate
+            top_p: Nucleus sampling parameter
+
+        Returns:
+            List of response strings, one per message set, in input order
+        """
+        if self.provider != 'api-endpoint':
+            raise ValueError("Batch API completions require the 'api-endpoint' provider")
+
+        # Get defaults from config if not provided
+        generation_config = self.config.get('generation', {})
+        temperature = temperature if temperature is not None else generation_config.get('temperature', 0.1)
+        max_tokens = max_tokens if max_tokens is not None else generation_config.get('max_tokens', 4096)
+        top_p = top_p if top_p is not None else generation_config.get('top_p', 0.95)
+
+        verbose = self._verbose
+
+        # Serialise every request with a stable custom_id so results can be
+        # reordered after the batch completes
+        lines = []
+        for i, messages in enumerate(message_batches):
+            lines.append(json.dumps({
+                "custom_id": f"doc-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": messages,
+                    "temperature": temperature,
+                    "max_tokens": max_tokens,
+                    "top_p": top_p
+                }
+            }))
+        batch_input = "\n".join(lines).encode('utf-8')
+
+        batch_file = self.openai_client.files.create(
+            file=("batch_input.jsonl", batch_input),
+            purpose="batch"
+        )
+        batch = self.openai_client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+
+        if verbose:
+            logger.info(f"Submitted batch {batch.id} with {len(message_batches)} requests")
+
+        # Poll with a gentle backoff until the batch reaches a terminal state
+        poll_delay = self.sleep_time or 1.0
+        while batch.status not in ("completed", "failed", "cancelled", "expired"):
+            time.sleep(poll_delay)
+            poll_delay = min(poll_delay * 2, 60.0)
+            batch = self.openai_client.batches.retrieve(batch.id)
+            if verbose:
+                logger.info(f"Batch {batch.id} status: {batch.status}")
+
+        if batch.status != "completed":
+            raise Exception(f"Batch {batch.id} finished with status '{batch.status}'")
+
+        output = self.openai_client.files.content(batch.output_file_id)
+        results = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            body = record["response"]["body"]
+            results[record["custom_id"]] = body["choices"][0]["message"]["content"]
+
+        return [results[f"doc-{i}"] for i in range(len(message_batches))]
+
+    async def _process_message_async(self,
                                     messages: List[Dict[str, str]], 
                                     temperature: float,
                                     max_tokens: int,
@@ -524,7 +739,7 @@ class LLMClient:
                 return await asyncio.gather(*tasks)
             
             # Run the async batch processing
-            batch_results = asyncio.run(process_batch())
+            batch_results = _run_coroutine(process_batch())
             results.extend(batch_results)
             
             # Small delay between batches to avoid rate limits
@@ -540,58 +755,33 @@ class LLMClient:
                              top_p: float,
                              batch_size: int,
                              verbose: bool) -> List[str]:
-        """Process multiple message sets in batches using vLLM's API"""
-        results = []
-        
-        # Process message batches in chunks to avoid overloading the server
-        for i in range(0, len(message_batches), batch_size):
-            batch_chunk = message_batches[i:i+batch_size]
-            if verbose:
-                logger.info(f"Processing batch {i//batch_size + 1}/{(len(message_batches) + batch_size - 1) // batch_size} with {len(batch_chunk)} requests")
-            
-            # Create batch request payload for VLLM
-            batch_requests = []
-            for messages in batch_chunk:
-                batch_requests.append({
-                    "model": self.model,
-                    "messages": messages,
-                    "temperature": temperature,
-                    "max_tokens": max_tokens,
-                    "top_p": top_p
-                })
-            
+        """Process multiple message sets concurrently against vLLM's API
+
+        All requests go through one pooled httpx.AsyncClient (no per-call
+        TCP/TLS handshake) with a semaphore capping in-flight requests at
+        batch_size, so the server actually sees concurrent work instead of
+        sequential posts.
+        """
+        if verbose:
+            logger.info(f"Dispatching {len(message_batches)} requests to vLLM model {self.model} "
+                        f"({batch_size} in flight)")
+
+        async def process_all():
+            sem = asyncio.Semaphore(batch_size)
+
+            async def one(messages):
+                async with sem:
+                    return await self._vllm_acomplete(messages, temperature, max_tokens, top_p, verbose)
+
             try:
-                # For now, we run these in parallel with multiple requests
-                batch_results = []
-                for request_data in batch_requests:
-                    # Only print if verbose mode is enabled
-                    if verbose:
-                        logger.info(f"Sending batch request to vLLM model {self.model}...")
-                    
-                    response = requests.post(
-                        f"{self.api_base}/chat/completions",
-                        headers={"Content-Type": "application/json"},
-                        data=json.dumps(request_data),
-                        timeout=180  # Increased timeout for batch processing
-                    )
-                    
-                    if verbose:
-                        logger.info(f"Received response with status code: {response.status_code}")
-                    
-                    response.raise_for_status()
-                    content = response.json()["choices"][0]["message"]["content"]
-                    batch_results.append(content)
-                
-                results.extend(batch_results)
-                
-            except (requests.exceptions.RequestException, KeyError, IndexError) as e:
-                raise Exception(f"Failed to process vLLM batch: {str(e)}")
-            
-            # Small delay between batches
-            if i + batch_size < len(message_batches):
-                time.sleep(self.sleep_time)
-        
-        return results
+                return await asyncio.gather(*(one(messages) for messages in message_batches))
+            finally:
+                await self._aclose_async_http_client()
+
+        try:
+            return list(_run_coroutine(process_all()))
+        except Exception as e:
+            raise Exception(f"Failed to process vLLM batch: {str(e)}")
     
     @classmethod
     def from_config(cls, config_path: Path) -> 'LLMClient':
@@ -6,48 +6,54 @@
 # Parquet parser logic
 
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator
+
+# Rows per streamed batch; bounds parser memory regardless of file size
+_BATCH_SIZE = 65536
 
 class ParquetParser:
     """Parser for Parquet files"""
-    
-    def parse(self, file_path: str) -> List[Dict[str, Any]]:
+
+    def parse(self, file_path: str) -> Iterator[Dict[str, Any]]:
         """Parse a Parquet file into plain text
-        
+
+        Streams the file batch by batch instead of loading all rows into
+        memory, so multi-GB inputs parse in O(batch) memory.
+
         Args:
             file_path: Path to the Parquet file
-            
+
         Returns:
-            List of dictionaries with text content extracted from the parquet file
+            Iterator of dictionaries with text content extracted from the parquet file
         """
         try:
-            import pandas as pd
+            import pyarrow.parquet as pq
         except ImportError:
             raise ImportError(
-                "pandas is required for Parquet parsing. Install it with: pip install pandas pyarrow"
+                "pyarrow is required for Parquet parsing. Install it with: pip install pandas pyarrow"
             )
-        
-        # Read the parquet file
-        df = pd.read_parquet(file_path)
-        
-        # Check if there's a 'text' column - raise error if not present
-        if 'text' not in df.columns:
-            available_columns = ", ".join(df.columns)
+
+        # Check the schema before reading any data - raise error if 'text' is missing
+        parquet_file = pq.ParquetFile(file_path)
+        if 'text' not in parquet_file.schema_arrow.names:
+            available_columns = ", ".join(parquet_file.schema_arrow.names)
             raise ValueError(
                 f"Parquet file must contain a 'text' column. "
                 f"Available columns: {available_columns}"
             )
-        
-        # Extract text and id columns only
-        result = []
-        for _, row in df.iterrows():
-            row_dict = {
-                "text": str(row['text']),
-                "id": row['id']
-            }
-            result.append(row_dict)
-        
-        return result
+
+        # Read only the two columns used downstream and convert them
+        # column-wise per batch, instead of boxing every row into a
+        # pandas Series with df.iterrows()
+        def rows():
+            for batch in parquet_file.iter_batches(batch_size=_BATCH_SIZE,
+                                                   columns=['text', 'id']):
+                texts = batch.column('text').to_pylist()
+                ids = batch.column('id').to_pylist()
+                for text, doc_id in zip(texts, ids):
+                    yield {"text": str(text), "id": doc_id}
+
+        return rows()
     
     def save(self, content: str, output_path: str) -> None:
         """Save the extracted text to a file
@@ -6,22 +6,32 @@
 
 import lance
 import pyarrow as pa
-from typing import List, Dict, Any, Optional
+from itertools import islice
+from typing import Dict, Any, Iterable, Optional
 import os
 
+# Rows per record batch when writing from an iterable source
+_WRITE_BATCH_SIZE = 65536
+
 def create_lance_dataset(
-    data: List[Dict[str, Any]],
+    data: Iterable[Dict[str, Any]],
     output_path: str,
     schema: Optional[pa.Schema] = None
 ) -> None:
-    """Create a Lance dataset from a list of dictionaries.
+    """Create a Lance dataset from an iterable of dictionaries.
+
+    Rows are consumed in bounded batches, so a generator source (e.g. a
+    streaming parser) is written out without ever materialising the full
+    dataset in memory.
 
     Args:
-        data (List[Dict[str, Any]]): A list of dictionaries, where each dictionary represents a row.
+        data (Iterable[Dict[str, Any]]): An iterable of dictionaries, where each dictionary represents a row.
         output_path (str): The path to save the Lance dataset.
         schema (Optional[pa.Schema], optional): The PyArrow schema. If not provided, it will be inferred. Defaults to None.
     """
-    if not data:
+    rows = iter(data)
+    first_chunk = list(islice(rows, _WRITE_BATCH_SIZE))
+    if not first_chunk:
         return
 
     # Ensure the output directory exists
@@ -29,8 +39,17 @@ def create_lance_dataset(
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
 
-    table = pa.Table.from_pylist(data, schema=schema)
-    lance.write_dataset(table, output_path, mode="overwrite")
+    if schema is None:
+        schema = pa.Table.from_pylist(first_chunk).schema
+
+    def batches():
+        chunk = first_chunk
+        while chunk:
+            yield pa.RecordBatch.from_pylist(chunk, schema=schema)
+            chunk = list(islice(rows, _WRITE_BATCH_SIZE))
+
+    reader = pa.RecordBatchReader.from_batches(schema, batches())
+    lance.write_dataset(reader, output_path, mode="overwrite")
 
 def load_lance_dataset(
     dataset_path: str
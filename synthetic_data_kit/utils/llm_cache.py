@@ -0,0 +1,85 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the terms described in the LICENSE file in
+# the root directory of this source tree.
+# Exact-match response cache for LLM calls
+
+import hashlib
+import json
+import os
+import sqlite3
+from typing import Any, Dict, List, Optional, Tuple
+
+# Default location for the cache database
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "synthetic-data-kit", "llm_responses.db"
+)
+
+
+def response_cache_key(model: Optional[str],
+                       messages: List[Dict[str, str]],
+                       sampling: Optional[Tuple[Any, ...]] = None) -> str:
+    """Compute a stable cache key for a (model, messages, sampling) request
+
+    The key is a sha256 over the canonical JSON of the model name, the
+    full message list and the sampling settings, so identical requests
+    always map to the same row while any change to the prompt content or
+    to temperature/max_tokens/top_p produces a miss.
+
+    Args:
+        model: Model name the request targets
+        messages: List of message dictionaries with 'role' and 'content'
+        sampling: Resolved sampling settings the response depends on,
+            e.g. (temperature, max_tokens, top_p)
+
+    Returns:
+        Hex digest string usable as a cache key
+    """
+    payload = json.dumps([model, messages, sampling], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """SQLite-backed exact cache of LLM responses keyed by request hash
+
+    Re-running generation over unchanged documents re-sends identical
+    (system, user) prompts; this cache answers those from disk instead of
+    paying the LLM round trip again. WAL mode keeps concurrent readers
+    cheap and writes are done through prepared statements.
+    """
+
+    def __init__(self, cache_path: Optional[str] = None):
+        """Open (creating if needed) the cache database
+
+        Args:
+            cache_path: Path to the SQLite file (defaults to
+                ~/.cache/synthetic-data-kit/llm_responses.db)
+        """
+        self.cache_path = cache_path or DEFAULT_CACHE_PATH
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+
+        self._conn = sqlite3.connect(self.cache_path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for a key, or None on a miss"""
+        row = self._conn.execute(
+            "SELECT response FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    def put(self, key: str, value: str) -> None:
+        """Store a response for a key, replacing any previous entry"""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)", (key, value)
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        self._conn.close()
@@ -9,16 +9,26 @@ import json
 import os
 from typing import List, Dict, Any, Optional
 
-def parse_qa_pairs(text: str) -> List[Dict[str, str]]:
-    """Parse QA pairs from LLM output in plain text format: '- Question: ... Answer: ...'"""
-    verbose = os.environ.get('SDK_VERBOSE', 'false').lower() == 'true'
-    
+# Pattern for: "- Question: ... Answer: ...", compiled once at import time
+# instead of on every parse_qa_pairs call
+_QA_PAIR_PATTERN = re.compile(
+    r'-\s*Question:\s*(.+?)\s+Answer:\s*(.+?)(?=\s*-\s*Question:|$)',
+    re.DOTALL | re.IGNORECASE,
+)
+
+def parse_qa_pairs(text: str, verbose: Optional[bool] = None) -> List[Dict[str, str]]:
+    """Parse QA pairs from LLM output in plain text format: '- Question: ... Answer: ...'
+
+    The caller's explicit verbose flag is authoritative; the SDK_VERBOSE
+    environment variable is only consulted when none is passed.
+    """
+    if verbose is None:
+        verbose = os.environ.get('SDK_VERBOSE', 'false').lower() == 'true'
+
     if verbose:
         print(f"Parsing response of length {len(text)}")
-    
-    # Pattern for: "- Question: ... Answer: ..."
-    plain_text_pattern = r'-\s*Question:\s*(.+?)\s+Answer:\s*(.+?)(?=\s*-\s*Question:|$)'
-    matches = re.finditer(plain_text_pattern, text, re.DOTALL | re.IGNORECASE)
+
+    matches = _QA_PAIR_PATTERN.finditer(text)
     pairs = []
     
     for match in matches:
@@ -39,24 +49,27 @@ def parse_qa_pairs(text: str) -> List[Dict[str, str]]:
     
     return pairs
 
-def parse_ratings(text: str, original_items: List[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+def parse_ratings(text: str, original_items: List[Dict[str, str]] = None,
+                  verbose: Optional[bool] = None) -> List[Dict[str, Any]]:
     """Parse rated items from LLM output
-    
+
     Attempts to parse JSON from LLM response. Will raise an exception if
     parsing fails. Never adds default ratings - either the model returns valid
     ratings or the function will crash.
-    
+
     Args:
         text: LLM response text to parse
         original_items: Original QA pairs (ignored - no defaults used)
-    
+        verbose: Whether to show detailed output (falls back to SDK_VERBOSE)
+
     Returns:
         List of items with ratings from the LLM
-        
+
     Raises:
         ValueError: If the response cannot be parsed as valid JSON
     """
-    verbose = os.environ.get('SDK_VERBOSE', 'false').lower() == 'true'
+    if verbose is None:
+        verbose = os.environ.get('SDK_VERBOSE', 'false').lower() == 'true'
     
     if verbose:
         print(f"Parsing ratings response of length {len(text)}")
@@ -0,0 +1,44 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the terms described in the LICENSE file in
+# the root directory of this source tree.
+# Numeric helpers for per-document metadata
+
+import numpy as np
+
+# Numba is optional: when present the ratio kernel is JIT-compiled and
+# parallelised, otherwise the pure-NumPy expression is used
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _ratios_jit(orig: np.ndarray, new: np.ndarray) -> np.ndarray:
+        ratios = np.empty(orig.size, dtype=np.float64)
+        for i in prange(orig.size):
+            denom = orig[i] if orig[i] > 1 else 1
+            ratios[i] = new[i] / denom
+        return ratios
+
+
+def compression_ratios(orig_lens: np.ndarray, new_lens: np.ndarray) -> np.ndarray:
+    """Compute new/original length ratios with a floor of 1 on the original
+
+    Uses the Numba-compiled kernel when numba is installed, falling back to
+    plain NumPy otherwise.
+
+    Args:
+        orig_lens: Original document lengths (int64 array)
+        new_lens: Generated text lengths (int64 array)
+
+    Returns:
+        Array of float64 ratios, one per document
+    """
+    if NUMBA_AVAILABLE:
+        return _ratios_jit(orig_lens, new_lens)
+    return new_lens / np.maximum(orig_lens, 1)
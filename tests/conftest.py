@@ -4,6 +4,7 @@ import json
 import os
 import tempfile
 from pathlib import Path
+from types import MappingProxyType
 from unittest.mock import MagicMock, patch
 from contextlib import contextmanager
 
@@ -12,6 +13,10 @@ import pytest
 # Import our test utilities
 from tests.utils import TempDirectoryManager
 
+# Keep the QA generator's shared parse pool small in tests: a
+# cpu_count-wide pool per pytest-xdist worker multiplies fork cost
+os.environ.setdefault("SDK_PARSE_WORKERS", "2")
+
 
 @pytest.fixture
 def sample_data_path():
@@ -74,6 +79,54 @@ def sample_qa_pairs_file():
         os.unlink(file_path)
 
 
+class StubLLMClient:
+    """Minimal LLM client stand-in for generator tests.
+
+    Much cheaper to build and call than MagicMock (no child-mock
+    accounting) while recording just enough for the assertions the tests
+    make: whether batch_completion ran, how often, and with what.
+    """
+
+    __slots__ = ("responses", "called", "call_count", "call_args_list", "_consumed", "_verbose")
+
+    def __init__(self, responses=()):
+        self.responses = list(responses)
+        self.called = False
+        self.call_count = 0
+        self.call_args_list = []
+        self._consumed = 0
+        self._verbose = False
+
+    def batch_completion(self, message_batches, **kwargs):
+        self.called = True
+        self.call_count += 1
+        self.call_args_list.append((message_batches, kwargs))
+        start = self._consumed
+        self._consumed += len(message_batches)
+        return self.responses[start:self._consumed]
+
+    def chat_completion(self, messages, **kwargs):
+        self.called = True
+        self.call_count += 1
+        self.call_args_list.append((messages, kwargs))
+        return self.responses[0] if self.responses else ""
+
+
+class StubAsyncLLMClient(StubLLMClient):
+    """Stub client whose coroutine acomplete routes generators through the
+    concurrent asyncio.gather dispatch path instead of batch_completion."""
+
+    __slots__ = ()
+
+    async def acomplete(self, messages, **kwargs):
+        self.called = True
+        self.call_count += 1
+        self.call_args_list.append((messages, kwargs))
+        start = self._consumed
+        self._consumed += 1
+        return self.responses[start]
+
+
 # Mock factories for reusable test components
 
 
@@ -228,11 +281,21 @@ def test_env():
     os.environ.update(original_env)
 
 
-@pytest.fixture
-def patch_config(config_factory):
-    """Patch the config loader to return a mock configuration."""
+# Frozen config served by patch_config; read-only so one instance can be
+# shared by every test in a module without cross-test interference
+_API_CONFIG = MappingProxyType(MockConfigFactory.create_api_config())
+
+
+@pytest.fixture(scope="module")
+def patch_config():
+    """Patch the config loader to return a mock configuration.
+
+    Module-scoped so the mock is entered once per test module instead of
+    per test; session scope would leak into tests that exercise the real
+    loader (e.g. test_load_config).
+    """
     with patch("synthetic_data_kit.utils.config.load_config") as mock_load_config:
-        mock_load_config.return_value = config_factory.create_api_config()
+        mock_load_config.return_value = _API_CONFIG
         yield mock_load_config
 
 
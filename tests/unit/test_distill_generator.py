@@ -3,9 +3,22 @@
 import pytest
 from unittest.mock import MagicMock
 
+from tests.conftest import StubLLMClient
 from synthetic_data_kit.generators.distill_generator import DistillGenerator
 
 
+# Shared literals hoisted so repeated runs reuse the same objects
+_DISTILL_RESPONSES = (
+    "This is the distilled version of document 1.",
+    "This is the distilled version of document 2.",
+)
+
+_DOCS = (
+    {"id": "doc1", "text": "This is a very long document 1 that needs to be distilled into a shorter version."},
+    {"id": "doc2", "text": "This is a very long document 2 that needs to be distilled into a shorter version."},
+)
+
+
 @pytest.mark.unit
 def test_distill_generator_initialization(patch_config):
     """Test Distill generator initialization."""
@@ -24,34 +37,27 @@ def test_distill_generator_initialization(patch_config):
 @pytest.mark.unit
 def test_process_documents(patch_config):
     """Test processing documents to distill text."""
-    # Create mock LLM client
-    mock_client = MagicMock()
-    mock_client.batch_completion.return_value = [
-        "This is the distilled version of document 1.",
-        "This is the distilled version of document 2."
-    ]
+    # Create stub LLM client
+    mock_client = StubLLMClient(_DISTILL_RESPONSES)
 
     # Initialize generator
     generator = DistillGenerator(client=mock_client)
 
     # Process documents
-    documents = [
-        {"id": "doc1", "text": "This is a very long document 1 that needs to be distilled into a shorter version."},
-        {"id": "doc2", "text": "This is a very long document 2 that needs to be distilled into a shorter version."}
-    ]
-    
+    documents = list(_DOCS)
+
     results = generator.process_documents(documents=documents, verbose=False)
 
     # Check that the results contain distilled text
     assert len(results) == 2
     assert results[0]["id"] == "doc1"
-    assert results[0]["text"] == "This is the distilled version of document 1."
+    assert results[0]["text"] == _DISTILL_RESPONSES[0]
     assert results[0]["original_length"] == len(documents[0]["text"])
-    assert results[0]["distilled_length"] == len("This is the distilled version of document 1.")
+    assert results[0]["distilled_length"] == len(_DISTILL_RESPONSES[0])
     assert "compression_ratio" in results[0]
     
     # Check that batch_completion was called
-    assert mock_client.batch_completion.called
+    assert mock_client.called
 
 
 @pytest.mark.unit
@@ -4,28 +4,46 @@
 # This source code is licensed under the terms described in the LICENSE file in
 # the root directory of this source tree.
 import pytest
+from types import MappingProxyType
 from unittest.mock import MagicMock, patch
 
+from tests.conftest import StubLLMClient
 from synthetic_data_kit.generators.extract_knowledge_generator import ExtractKnowledgeGenerator
 
 
-# Patch config loading at module level
-@pytest.fixture(autouse=True)
+# Shared literals hoisted so repeated runs reuse the same objects
+_EXTRACT_RESPONSES = (
+    "This is a rewritten passage that clearly explains the key concepts from document 1.",
+    "This is a rewritten passage that clearly explains the key concepts from document 2.",
+)
+
+_DOCS = (
+    {"id": "doc1", "text": "This is a document with complex information that needs to be rewritten clearly."},
+    {"id": "doc2", "text": "This is another document with detailed knowledge to extract and rewrite."},
+)
+
+
+# Frozen config shared by every test in this module
+_CFG = MappingProxyType({
+    'generation': {
+        'batch_size': 32,
+        'temperature': 0.7,
+        'single_call_max_size': 8000
+    },
+    'prompts': {
+        'extract_knowledge': {
+            'system': 'You are an expert at extracting knowledge.',
+            'user': 'Extract knowledge from:\n{text}'
+        }
+    }
+})
+
+
+# Patch config loading once per module rather than per test
+@pytest.fixture(scope="module", autouse=True)
 def patch_config():
     with patch('synthetic_data_kit.utils.config.load_config') as mock_load:
-        mock_load.return_value = {
-            'generation': {
-                'batch_size': 32,
-                'temperature': 0.7,
-                'single_call_max_size': 8000
-            },
-            'prompts': {
-                'extract_knowledge': {
-                    'system': 'You are an expert at extracting knowledge.',
-                    'user': 'Extract knowledge from:\n{text}'
-                }
-            }
-        }
+        mock_load.return_value = _CFG
         yield mock_load
 
 
@@ -47,33 +65,26 @@ def test_extract_knowledge_generator_initialization(patch_config):
 @pytest.mark.unit
 def test_process_documents(patch_config):
     """Test processing documents to extract knowledge."""
-    # Create mock LLM client
-    mock_client = MagicMock()
-    mock_client.batch_completion.return_value = [
-        "This is a rewritten passage that clearly explains the key concepts from document 1.",
-        "This is a rewritten passage that clearly explains the key concepts from document 2."
-    ]
+    # Create stub LLM client
+    mock_client = StubLLMClient(_EXTRACT_RESPONSES)
 
     # Initialize generator
     generator = ExtractKnowledgeGenerator(client=mock_client)
 
     # Process documents
-    documents = [
-        {"id": "doc1", "text": "This is a document with complex information that needs to be rewritten clearly."},
-        {"id": "doc2", "text": "This is another document with detailed knowledge to extract and rewrite."}
-    ]
-    
+    documents = list(_DOCS)
+
     results = generator.process_documents(documents=documents, verbose=False)
 
     # Check that the results contain extracted knowledge
     assert len(results) == 2
     assert results[0]["id"] == "doc1"
-    assert results[0]["text"] == "This is a rewritten passage that clearly explains the key concepts from document 1."
+    assert results[0]["text"] == _EXTRACT_RESPONSES[0]
     assert results[1]["id"] == "doc2"
-    assert results[1]["text"] == "This is a rewritten passage that clearly explains the key concepts from document 2."
+    assert results[1]["text"] == _EXTRACT_RESPONSES[1]
     
     # Check that batch_completion was called
-    assert mock_client.batch_completion.called
+    assert mock_client.called
 
 
 @pytest.mark.unit
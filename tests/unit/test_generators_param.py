@@ -0,0 +1,196 @@
+"""Parametrized tests shared by the generator subclasses.
+
+Collapses the near-identical process_documents / process_responses /
+_get_prompt_name tests that were hand-rolled per generator module.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+from tests.conftest import StubAsyncLLMClient, StubLLMClient
+from synthetic_data_kit.generators.knowledge_list_generator import KnowledgeListGenerator
+from synthetic_data_kit.generators.qa_generator import QAGenerator
+from synthetic_data_kit.generators.wikipedia_rephrase_generator import WikipediaRephraseGenerator
+
+
+_QA_RESPONSES = (
+    """Here are the questions and answers based on the provided text:
+- Question: What is synthetic data? Answer: Synthetic data is artificially generated data.
+- Question: Why use it? Answer: To protect privacy.""",
+    """Here are the questions and answers based on the provided text:
+- Question: What is machine learning? Answer: A method of data analysis.
+- Question: How does it work? Answer: By learning from patterns.""",
+)
+
+_KL_RESPONSES = (
+    "- Key fact 1\n- Key fact 2\n- Important concept A",
+    "- Key fact 3\n- Key fact 4\n- Important concept B",
+)
+
+_WIKI_RESPONSES = (
+    "Here is a paraphrased version: This is a Wikipedia-style paraphrase of document 1.",
+    "Here is a paraphrased version: This is a Wikipedia-style paraphrase of document 2.",
+)
+
+_DOCS = (
+    {"id": "doc1", "text": "This is document 1 about synthetic data."},
+    {"id": "doc2", "text": "This is document 2 about machine learning."},
+)
+
+
+def _make_client(responses):
+    """Build a stub LLM client returning the canned batch responses."""
+    return StubLLMClient(responses)
+
+
+def _qa_texts(result):
+    return [(pair["id"], pair["question"], pair["answer"]) for pair in result["qa_pairs"]]
+
+
+def _record_texts(results):
+    return [(record["id"], record["text"]) for record in results]
+
+
+# (generator class, prompt name, canned responses, result normaliser, expected)
+CASES = [
+    pytest.param(
+        QAGenerator,
+        "qa_generation",
+        _QA_RESPONSES,
+        _qa_texts,
+        [
+            ("doc1", "What is synthetic data?", "Synthetic data is artificially generated data."),
+            ("doc1", "Why use it?", "To protect privacy."),
+            ("doc2", "What is machine learning?", "A method of data analysis."),
+            ("doc2", "How does it work?", "By learning from patterns."),
+        ],
+        id="qa",
+    ),
+    pytest.param(
+        KnowledgeListGenerator,
+        "knowledge_list",
+        _KL_RESPONSES,
+        _record_texts,
+        [
+            ("doc1", _KL_RESPONSES[0]),
+            ("doc2", _KL_RESPONSES[1]),
+        ],
+        id="knowledge-list",
+    ),
+    pytest.param(
+        WikipediaRephraseGenerator,
+        "wikipedia_rephrase",
+        _WIKI_RESPONSES,
+        _record_texts,
+        [
+            ("doc1", "This is a Wikipedia-style paraphrase of document 1."),
+            ("doc2", "This is a Wikipedia-style paraphrase of document 2."),
+        ],
+        id="wikipedia-rephrase",
+    ),
+]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("gen_cls, prompt_name, responses, normalise, expected", CASES)
+def test_process_documents(patch_config, gen_cls, prompt_name, responses, normalise, expected):
+    """Each generator turns documents into its expected result shape."""
+    mock_client = _make_client(responses)
+    generator = gen_cls(client=mock_client)
+
+    result = generator.process_documents(documents=list(_DOCS), verbose=False)
+
+    assert normalise(result) == expected
+    assert mock_client.called
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("gen_cls, prompt_name, responses, normalise, expected", CASES)
+def test_process_documents_async(patch_config, gen_cls, prompt_name, responses, normalise, expected):
+    """A client exposing coroutine acomplete takes the concurrent gather path."""
+    mock_client = StubAsyncLLMClient(responses)
+    generator = gen_cls(client=mock_client)
+
+    result = generator.process_documents(documents=list(_DOCS), verbose=False)
+
+    assert normalise(result) == expected
+    # acomplete was awaited once per document, never batch_completion
+    assert mock_client.called
+    assert mock_client.call_count == len(_DOCS)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("gen_cls, prompt_name, responses, normalise, expected", CASES)
+def test_process_responses(patch_config, gen_cls, prompt_name, responses, normalise, expected):
+    """Each generator maps raw responses onto its documents."""
+    generator = gen_cls(client=MagicMock())
+
+    result = generator.process_responses(list(_DOCS), list(responses), verbose=False)
+
+    assert normalise(result) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("gen_cls", [QAGenerator, KnowledgeListGenerator, WikipediaRephraseGenerator])
+def test_process_documents_batches_at_configured_size(patch_config, gen_cls):
+    """Dispatch is batched at generation.batch_size, not per document."""
+    batch_size = 32
+    documents = [{"id": f"d{i}", "text": f"document {i} text"} for i in range(65)]
+    mock_client = StubLLMClient([f"- Question: Q{i}? Answer: A{i}" for i in range(65)])
+    generator = gen_cls(client=mock_client)
+
+    generator.process_documents(documents=documents, verbose=False)
+
+    # ceil(65 / 32) calls, each carrying at most batch_size prompts
+    assert mock_client.call_count == 3
+    assert [len(prompts) for prompts, _ in mock_client.call_args_list] == [32, 32, 1]
+    assert sum(len(prompts) for prompts, _ in mock_client.call_args_list) == 65
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("gen_cls, prompt_name, responses, normalise, expected", CASES)
+def test_prompts_share_identical_system_prefix(patch_config, gen_cls, prompt_name,
+                                               responses, normalise, expected):
+    """Every dispatched prompt starts with the same system message.
+
+    Provider-side prompt-prefix caching only hits when the stable system
+    prompt comes first and is byte-identical across calls.
+    """
+    mock_client = StubLLMClient(responses)
+    generator = gen_cls(client=mock_client)
+
+    generator.process_documents(documents=list(_DOCS), verbose=False)
+
+    dispatched = [messages for prompts, _ in mock_client.call_args_list for messages in prompts]
+    system_content = generator._get_cached_prompt()["system"]
+    assert dispatched
+    assert all(messages[0]["role"] == "system" for messages in dispatched)
+    assert all(messages[0]["content"] == system_content for messages in dispatched)
+    # The prefix is one shared object, so it cannot drift between calls
+    assert len({id(messages[0]) for messages in dispatched}) == 1
+
+
+@pytest.mark.unit
+def test_process_documents_caches_identical_inputs(patch_config, tmp_path):
+    """With the response cache on, a repeat run never reaches the LLM."""
+    mock_client = StubLLMClient(_KL_RESPONSES)
+    generator = KnowledgeListGenerator(client=mock_client)
+    generator.generation_config = dict(generator.generation_config)
+    generator.generation_config["cache_responses"] = True
+    generator.generation_config["cache_path"] = str(tmp_path / "responses.db")
+
+    first = generator.process_documents(documents=list(_DOCS), verbose=False)
+    second = generator.process_documents(documents=list(_DOCS), verbose=False)
+
+    # The second run is served entirely from the cache
+    assert mock_client.call_count == 1
+    assert _record_texts(second) == _record_texts(first)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("gen_cls, prompt_name, responses, normalise, expected", CASES)
+def test_get_prompt_name(patch_config, gen_cls, prompt_name, responses, normalise, expected):
+    """Each generator reports its configured prompt name."""
+    generator = gen_cls(client=MagicMock())
+
+    assert generator._get_prompt_name() == prompt_name
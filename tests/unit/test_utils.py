@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from synthetic_data_kit.utils import config, text
+from synthetic_data_kit.utils import config, llm_processing, text
 
 
 @pytest.mark.unit
@@ -94,6 +94,19 @@ def test_extract_json_list_from_text():
     assert result[1]["question"] == "Why use synthetic data?"
 
 
+@pytest.mark.unit
+def test_parse_qa_pairs_uses_module_regex():
+    """The QA pattern is compiled once at import, not per parse call."""
+    import re
+
+    assert isinstance(llm_processing._QA_PAIR_PATTERN, re.Pattern)
+
+    pairs = llm_processing.parse_qa_pairs(
+        "- Question: What is this? Answer: A test.", verbose=False
+    )
+    assert pairs == [{"question": "What is this?", "answer": "A test."}]
+
+
 @pytest.mark.unit
 def test_load_config(tmpdir):
     """Test loading config from file."""